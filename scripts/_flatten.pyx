@@ -0,0 +1,41 @@
+# cython: language_level=3
+"""
+Compiled counterpart of json_to_excel.flatten_dict.
+
+Build in place with:
+    cythonize -i scripts/_flatten.pyx
+
+json_to_excel.py uses this module when the extension has been built and falls
+back to its pure-Python implementation otherwise, so both must stay in sync.
+"""
+
+from sys import intern
+
+def flatten(dict d, str parent_key='', str sep='.'):
+    """
+    Flatten a nested dictionary, joining keys with a separator.
+
+    Args:
+        d: Nested dictionary to flatten.
+        parent_key: Prefix for all flattened keys (default: '').
+        sep: Separator for joining keys (default: '.').
+
+    Returns:
+        Flattened dictionary with string values.
+    """
+    cdef dict flat = {}
+    cdef list stack = [(parent_key, iter(d.items()))]
+    cdef str prefix
+    cdef object items, k, v, new_key
+    while stack:
+        prefix, items = stack[-1]
+        for k, v in items:
+            new_key = f"{prefix}{sep}{k}" if prefix else k
+            if isinstance(v, dict):
+                stack.append((new_key, iter((<dict>v).items())))
+                break
+            # Interned so each key shared across language files is stored only once
+            flat[intern(new_key)] = v if isinstance(v, str) else str(v)
+        else:
+            stack.pop()
+    return flat
@@ -1,9 +1,25 @@
+import argparse
+import datetime
 import pandas as pd
 import json
 import os
 import re
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # Optional fast path; pandas is used otherwise
+    CalamineWorkbook = None
+
+try:
+    import orjson
+except ImportError:  # Optional fast path; the json module is used otherwise
+    orjson = None
+
+LANG_RE = re.compile(r'^[a-z]{2}-[A-Z]{2}$')
+
 def unflatten_dict(flat_dict: Dict[str, str], sep: str = '.') -> Dict[str, Any]:
     """
     Convert a flattened dictionary back to a nested dictionary.
@@ -16,21 +32,56 @@ def unflatten_dict(flat_dict: Dict[str, str], sep: str = '.') -> Dict[str, Any]:
         Nested dictionary.
     """
     nested_dict = {}
+    # Parent path of the previous key and the dict it resolved to; consecutive keys
+    # usually share a parent, so the tree is only walked when the path changes
+    cached_path = None
+    cached_parent = nested_dict
     for key, value in flat_dict.items():
         if not value:  # Skip empty values
             continue
-        parts = key.split(sep)
-        current = nested_dict
-        for i, part in enumerate(parts[:-1]):
-            if part not in current:
-                current[part] = {}
-            current = current[part]
-        current[parts[-1]] = value
+        path, found, leaf = key.rpartition(sep)
+        if not found:
+            path = None  # Top-level key
+        if path != cached_path:
+            current = nested_dict
+            if path is not None:
+                for part in path.split(sep):
+                    current = current.setdefault(part, {})
+            cached_path, cached_parent = path, current
+        cached_parent[leaf] = value
     return nested_dict
 
-def read_excel_to_translations(excel_file: str) -> Dict[str, Dict[str, str]]:
+def _cell_to_str(value: Any) -> str:
     """
-    Read translations from an Excel file.
+    Convert a raw Excel cell value to translation text.
+
+    Both Excel readers use this so the output does not depend on which one is
+    installed. Empty, whitespace-only and error (#N/A, #REF!) cells become '',
+    which callers treat as missing; text such as 'NA' or 'null' is kept as-is.
+
+    Args:
+        value: Cell value as returned by calamine or openpyxl.
+
+    Returns:
+        Cell text, or '' for an empty cell.
+    """
+    if value is None:
+        return ''
+    if isinstance(value, float) and value != value:
+        return ''  # pandas reads error cells such as #N/A as NaN; calamine drops them
+    if isinstance(value, str):
+        # calamine already reads whitespace-only text as empty; match it here
+        return value if value.strip() else ''
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))  # Whole numbers are stored as floats in xlsx
+    if isinstance(value, datetime.date) and not isinstance(value, datetime.datetime):
+        # calamine returns date-only cells as dates, openpyxl as midnight datetimes
+        value = datetime.datetime.combine(value, datetime.time())
+    return str(value)
+
+def _read_with_calamine(excel_file: str) -> Dict[str, Dict[str, str]]:
+    """
+    Read translations from the first sheet using python-calamine.
 
     Args:
         excel_file: Path to the Excel file.
@@ -38,57 +89,197 @@ def read_excel_to_translations(excel_file: str) -> Dict[str, Dict[str, str]]:
     Returns:
         Dictionary mapping language codes to flattened translation dictionaries.
     """
-    if not os.path.isfile(excel_file):
-        raise FileNotFoundError(f"Excel file {excel_file} does not exist!")
+    try:
+        rows = CalamineWorkbook.from_path(excel_file).get_sheet_by_index(0).to_python()
+    except Exception as e:
+        raise ValueError(f"Failed to read Excel file: {e}")
+
+    if not rows:
+        return {}
+    header = rows[0]
+    if 'Key' not in header:
+        raise ValueError("Failed to read Excel file: missing 'Key' column")
+    key_col = header.index('Key')
+    lang_cols = [(j, lang_code) for j, lang_code in enumerate(header) if j != key_col and lang_code != '']
 
-    # Read Excel file
+    # Build flattened dictionaries directly from the rows, skipping empty cells
+    translations = {lang_code: {} for _, lang_code in lang_cols}
+    for row in rows[1:]:
+        key = _cell_to_str(row[key_col])
+        if not key:
+            continue
+        for j, lang_code in lang_cols:
+            value = _cell_to_str(row[j])
+            if value:
+                translations[lang_code][key] = value
+
+    return translations
+
+def _read_with_pandas(excel_file: str) -> Dict[str, Dict[str, str]]:
+    """
+    Read translations using pandas and openpyxl.
+
+    Args:
+        excel_file: Path to the Excel file.
+
+    Returns:
+        Dictionary mapping language codes to flattened translation dictionaries.
+    """
+    # Read Excel file. Every cell goes through _cell_to_str before pandas infers
+    # types, so only empty cells become NaN; pandas' default NA strings such as
+    # 'NA' or 'null' are kept as text, matching the calamine reader.
     try:
-        df = pd.read_excel(excel_file, index_col='Key')
+        with pd.ExcelFile(excel_file) as xls:
+            columns = xls.parse(nrows=0).columns
+            if 'Key' not in columns:
+                raise ValueError("missing 'Key' column")
+            df = xls.parse(converters={column: _cell_to_str for column in columns},
+                           keep_default_na=False, na_values=[''])
     except Exception as e:
         raise ValueError(f"Failed to read Excel file: {e}")
 
     # Extract language codes (columns) and translations
     translations = {}
+    key_column = df.pop('Key')
+    has_key = key_column.notna().to_numpy()
+    keys = key_column.to_numpy()
     for lang_code in df.columns:
-        # Create flattened dictionary for each language
-        lang_dict = {key: str(value) for key, value in df[lang_code].items() if pd.notna(value)}
-        translations[lang_code] = lang_dict
+        # Create flattened dictionary for each language; the missing-value mask is
+        # computed for the whole column at once rather than per cell in Python
+        column = df[lang_code]
+        mask = column.notna().to_numpy() & has_key
+        translations[lang_code] = dict(zip(keys[mask].tolist(), column.to_numpy()[mask].tolist()))
 
     return translations
 
-def save_translations_to_json(translations: Dict[str, Dict[str, str]], output_dir: str):
+def read_excel_to_translations(excel_file: str) -> Dict[str, Dict[str, str]]:
     """
-    Save translations as JSON files.
+    Read translations from an Excel file.
+
+    Uses python-calamine when it is installed, falling back to pandas otherwise.
+
+    Args:
+        excel_file: Path to the Excel file.
+
+    Returns:
+        Dictionary mapping language codes to flattened translation dictionaries.
+    """
+    if not os.path.isfile(excel_file):
+        raise FileNotFoundError(f"Excel file {excel_file} does not exist!")
+
+    if CalamineWorkbook is not None:
+        return _read_with_calamine(excel_file)
+    return _read_with_pandas(excel_file)
+
+def _encode_translations(flat_dict: Dict[str, str]) -> bytes:
+    """
+    Convert one language's flattened translations to UTF-8 encoded JSON.
+
+    Args:
+        flat_dict: Flattened translation dictionary for the language.
+
+    Returns:
+        JSON document as bytes, indented by 2 spaces.
+    """
+    # Convert flattened dictionary to nested structure
+    nested_dict = unflatten_dict(flat_dict)
+
+    if orjson is not None:
+        # orjson encodes to a single UTF-8 buffer; its indent is fixed at 2 spaces
+        return orjson.dumps(nested_dict, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    # Serialize up front so the output is written once rather than per token
+    return json.dumps(nested_dict, ensure_ascii=False, indent=2).encode('utf-8')
+
+def _write_one_lang(lang_code: str, flat_dict: Dict[str, str], output_dir: str) -> str:
+    """
+    Convert one language's translations and write them as a JSON file.
+
+    Args:
+        lang_code: Language code used as the file name.
+        flat_dict: Flattened translation dictionary for the language.
+        output_dir: Directory to save the JSON file.
+
+    Returns:
+        Status message describing the outcome.
+    """
+    # Validate language code
+    if not LANG_RE.match(lang_code):
+        return f"Skipping invalid language code: {lang_code}"
+
+    # Save to JSON file
+    output_file = os.path.join(output_dir, f"{lang_code}.json")
+    try:
+        data = _encode_translations(flat_dict)
+        with open(output_file, 'wb') as f:
+            f.write(data)
+        return f"Generated JSON file: {output_file}"
+    except Exception as e:
+        return f"Failed to write {output_file}: {e}"
+
+def _save_translations_to_archive(translations: Dict[str, Dict[str, str]], output_file: str):
+    """
+    Save translations as JSON members of a single uncompressed zip archive.
+
+    Languages are encoded concurrently and then written sequentially through one
+    file handle, avoiding a separate file open/close per language.
 
     Args:
         translations: Dictionary mapping language codes to flattened translation dictionaries.
-        output_dir: Directory to save JSON files.
+        output_file: Path to the zip archive.
     """
-    os.makedirs(output_dir, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=min(8, len(translations))) as executor:
+        futures = []
+        for lang_code, flat_dict in translations.items():
+            # Validate language code
+            if not LANG_RE.match(lang_code):
+                print(f"Skipping invalid language code: {lang_code}")
+                continue
+            futures.append((lang_code, executor.submit(_encode_translations, flat_dict)))
 
-    for lang_code in translations:
-        # Validate language code
-        if not re.match(r'^[a-z]{2}-[A-Z]{2}$', lang_code):
-            print(f"Skipping invalid language code: {lang_code}")
-            continue
-        
-        # Convert flattened dictionary to nested structure
-        flat_dict = translations[lang_code]
-        nested_dict = unflatten_dict(flat_dict)
-        
-        # Save to JSON file
-        output_file = os.path.join(output_dir, f"{lang_code}.json")
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(nested_dict, f, ensure_ascii=False, indent=2)
-            print(f"Generated JSON file: {output_file}")
+            with zipfile.ZipFile(output_file, 'w', zipfile.ZIP_STORED) as archive:
+                for lang_code, future in futures:
+                    archive.writestr(f"{lang_code}.json", future.result())
+            print(f"Generated archive: {output_file}")
         except Exception as e:
             print(f"Failed to write {output_file}: {e}")
 
+def save_translations_to_json(translations: Dict[str, Dict[str, str]], output_dir: str, archive: bool = False):
+    """
+    Save translations as JSON files.
+
+    Languages are converted and written concurrently, one task per language.
+
+    Args:
+        translations: Dictionary mapping language codes to flattened translation dictionaries.
+        output_dir: Directory to save JSON files.
+        archive: Write all languages into a single 'translations.zip' in output_dir
+            instead of separate files (default: False).
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    if not translations:
+        return
+
+    if archive:
+        _save_translations_to_archive(translations, os.path.join(output_dir, 'translations.zip'))
+        return
+
+    with ThreadPoolExecutor(max_workers=min(8, len(translations))) as executor:
+        futures = [executor.submit(_write_one_lang, lang_code, flat_dict, output_dir)
+                   for lang_code, flat_dict in translations.items()]
+        # Report in input order so the log stays deterministic
+        for future in futures:
+            print(future.result())
+
 def main():
     """
     Main function to read translations from Excel and generate JSON files.
     """
+    parser = argparse.ArgumentParser(description='Convert an Excel translation sheet to JSON files.')
+    parser.add_argument('--archive', action='store_true',
+                        help='write all JSON files into a single translations.zip')
+    args = parser.parse_args()
+
     # Get project root directory
     project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     excel_file = os.path.join(project_dir, 'input', 'translations.xlsx')
@@ -106,7 +297,7 @@ def main():
         return
 
     # Save translations as JSON files
-    save_translations_to_json(translations, output_dir)
+    save_translations_to_json(translations, output_dir, archive=args.archive)
 
 if __name__ == '__main__':
     main()
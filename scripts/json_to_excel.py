@@ -1,9 +1,27 @@
 import json
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 import pandas as pd
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import re
+import sys
+
+try:
+    import orjson
+except ImportError:  # Optional fast path; the json module is used otherwise
+    orjson = None
+
+try:
+    import xlsxwriter
+except ImportError:  # Optional; pandas falls back to openpyxl for writing
+    xlsxwriter = None
+
+try:
+    from _flatten import flatten as _flatten_compiled
+except ImportError:  # Cython extension not built; the pure-Python flatten_dict is used
+    _flatten_compiled = None
+
+LANG_JSON_RE = re.compile(r'^[a-z]{2}-[A-Z]{2}\.json$')
 
 def flatten_dict(d: Dict[str, Any], parent_key: str = '', sep: str = '.') -> Dict[str, str]:
     """
@@ -11,26 +29,66 @@ def flatten_dict(d: Dict[str, Any], parent_key: str = '', sep: str = '.') -> Dic
 
     Args:
         d: Nested dictionary to flatten.
-        parent_key: Parent key for recursive calls (default: '').
+        parent_key: Prefix for all flattened keys (default: '').
         sep: Separator for joining keys (default: '.').
 
     Returns:
         Flattened dictionary with string values.
     """
-    items = []
-    for k, v in d.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-        if isinstance(v, dict):
-            items.extend(flatten_dict(v, new_key, sep=sep).items())
+    if _flatten_compiled is not None:
+        return _flatten_compiled(d, parent_key, sep)
+
+    # Keep in sync with _flatten.pyx
+    flat = {}
+    # Explicit stack of (prefix, items iterator) keeps depth-first key order without recursion
+    stack = [(parent_key, iter(d.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for k, v in items:
+            new_key = f"{prefix}{sep}{k}" if prefix else k
+            if isinstance(v, dict):
+                stack.append((new_key, iter(v.items())))
+                break
+            # Interned so each key shared across language files is stored only once
+            flat[sys.intern(new_key)] = v if isinstance(v, str) else str(v)
         else:
-            value = str(v).strip('"')  # Remove extra quotes if any
-            items.append((new_key, value))
-    return dict(items)
+            stack.pop()
+    return flat
+
+def _load_one(lang_dir: str, file: str) -> Tuple[Optional[Dict[str, str]], Optional[str]]:
+    """
+    Load and flatten a single JSON translation file.
+
+    Args:
+        lang_dir: Directory containing the file.
+        file: File name, e.g. 'en-US.json'.
+
+    Returns:
+        Tuple of the flattened translations (None if the file could not be loaded)
+        and a message to report (None if there is nothing to report).
+    """
+    try:
+        with open(os.path.join(lang_dir, file), 'rb') as f:
+            raw = f.read()
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so one handler covers both
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw.decode('utf-8'))
+        # Release the file buffer before flattening so it is not held alongside both trees
+        del raw
+        flattened = flatten_dict(data)
+        if not flattened:
+            return flattened, f"Warning: {file} is empty or contains no valid translations"
+        return flattened, None
+    except UnicodeDecodeError:
+        return None, f"Encoding error in {file}: File must be UTF-8 encoded"
+    except json.JSONDecodeError as e:
+        return None, f"Error loading {file}: {e}"
 
 def load_json_files(lang_dir: str, valid_langs: set = None) -> Dict[str, Dict[str, str]]:
     """
     Load all JSON translation files from a directory.
 
+    Files are read and parsed concurrently, one task per file.
+
     Args:
         lang_dir: Directory containing JSON files.
         valid_langs: Set of valid language codes to load (optional).
@@ -42,25 +100,67 @@ def load_json_files(lang_dir: str, valid_langs: set = None) -> Dict[str, Dict[st
         print(f"Directory {lang_dir} does not exist!")
         return {}
 
+    # Collect candidate files first so they can be loaded in parallel
+    files = []
+    with os.scandir(lang_dir) as entries:
+        for entry in entries:
+            file = entry.name
+            # Cheap shape check ('xx-XX.json') before running the full pattern
+            if len(file) == 10 and file[2] == '-' and file.endswith('.json') and LANG_JSON_RE.match(file):
+                lang_code = file[:5]
+                if (valid_langs is None or lang_code in valid_langs) and entry.is_file():
+                    files.append((lang_code, file))
+
     translations = {}
-    lang_pattern = re.compile(r'^[a-z]{2}-[A-Z]{2}\.json$')
-    for file in os.listdir(lang_dir):
-        if file.endswith('.json') and lang_pattern.match(file):
-            lang_code = file.replace('.json', '')
-            if valid_langs is None or lang_code in valid_langs:
-                try:
-                    with open(os.path.join(lang_dir, file), 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        flattened = flatten_dict(data)
-                        if not flattened:
-                            print(f"Warning: {file} is empty or contains no valid translations")
-                        translations[lang_code] = flattened
-                except UnicodeDecodeError:
-                    print(f"Encoding error in {file}: File must be UTF-8 encoded")
-                except json.JSONDecodeError as e:
-                    print(f"Error loading {file}: {e}")
+    if not files:
+        return translations
+
+    with ThreadPoolExecutor(max_workers=min(16, len(files))) as executor:
+        futures = [(lang_code, executor.submit(_load_one, lang_dir, file)) for lang_code, file in files]
+        # Merge in listing order so the result and log stay deterministic
+        for lang_code, future in futures:
+            flattened, message = future.result()
+            if message:
+                print(message)
+            if flattened is not None:
+                translations[lang_code] = flattened
     return translations
 
+def _write_excel_constant_memory(df: pd.DataFrame, output_file: str):
+    """
+    Write a translation DataFrame with xlsxwriter in constant_memory mode.
+
+    Each row is flushed to disk as soon as it is written, so memory use does not
+    grow with the sheet size. The mode only accepts rows in order, which is why
+    rows are written here directly: DataFrame.to_excel fills the index column
+    before the data columns, and those later cells would be dropped.
+
+    Args:
+        df: DataFrame indexed by translation key with one column per language.
+        output_file: Path to the output Excel file.
+    """
+    # Translations are plain text: don't turn URL- or formula-like strings into
+    # hyperlinks or formulas (long URLs would otherwise be dropped entirely)
+    workbook = xlsxwriter.Workbook(output_file, {
+        'constant_memory': True,
+        'strings_to_urls': False,
+        'strings_to_formulas': False,
+    })
+    try:
+        worksheet = workbook.add_worksheet()
+        # Same style pandas' to_excel gives header and index cells
+        header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+        worksheet.write_row(0, 0, ['Key'] + df.columns.tolist(), header_format)
+        for row_num, row in enumerate(df.itertuples(index=True, name=None), start=1):
+            worksheet.write(row_num, 0, row[0], header_format)
+            worksheet.write_row(row_num, 1, row[1:])
+    finally:
+        try:
+            workbook.close()
+        except xlsxwriter.exceptions.FileCreateError as e:
+            # Re-raise the underlying OSError so callers can still catch PermissionError
+            raise e.args[0] from None
+
 def create_excel(translations: Dict[str, Dict[str, str]], output_file: str, priority_lang: str = 'en-US'):
     """
     Create an Excel file from translation dictionaries.
@@ -71,18 +171,20 @@ def create_excel(translations: Dict[str, Dict[str, str]], output_file: str, prio
         priority_lang: Language code to prioritize in column order (default: 'en-US').
     """
     # Collect all unique translation keys
-    all_keys = set()
-    for lang_dict in translations.values():
-        all_keys.update(lang_dict.keys())
+    all_keys = sorted(map(sys.intern, set().union(*(lang_dict.keys() for lang_dict in translations.values()))))
     
-    # Build data for DataFrame
-    df_data = defaultdict(dict)
-    for key in sorted(all_keys):
-        for lang_code, lang_dict in translations.items():
-            df_data[key][lang_code] = lang_dict.get(key, '')  # Use empty string for missing keys
+    # Build one column per language aligned to the sorted keys, visiting only the
+    # keys each language actually has
+    key_pos = {key: i for i, key in enumerate(all_keys)}
+    columns = {}
+    for lang_code, lang_dict in translations.items():
+        column = [''] * len(all_keys)  # Use empty string for missing keys
+        for key, value in lang_dict.items():
+            column[key_pos[key]] = value
+        columns[lang_code] = column
     
     # Convert to DataFrame
-    df = pd.DataFrame.from_dict(df_data, orient='index')
+    df = pd.DataFrame(columns, index=all_keys)
     
     # Sort columns with priority language first
     cols = df.columns.tolist()
@@ -95,7 +197,10 @@ def create_excel(translations: Dict[str, Dict[str, str]], output_file: str, prio
     
     # Save to Excel
     try:
-        df.to_excel(output_file, index=True, index_label='Key')
+        if xlsxwriter is not None:
+            _write_excel_constant_memory(df, output_file)
+        else:
+            df.to_excel(output_file, index=True, index_label='Key')
         print(f"Excel file created: {output_file}")
     except PermissionError:
         print(f"Permission denied when writing to {output_file}")